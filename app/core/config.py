@@ -1,8 +1,9 @@
-from pydantic_settings import BaseSettings
-from pydantic import Field, AnyHttpUrl
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator, model_validator
 from typing import Optional, List
 from enum import Enum
 from pathlib import Path
+from functools import lru_cache
 import os
 
 class Environment(str, Enum):
@@ -35,10 +36,11 @@ class BaseConfig(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = Field(12, ge=4, le=31)  # bcrypt's own cost limits
 
     # === CORS ===
     ALLOWED_HOSTS: List[str] = Field(default_factory=lambda: ["*"])
-    ALLOWED_ORIGINS: List[AnyHttpUrl] = Field(default_factory=lambda: [])
+    ALLOWED_ORIGINS: List[str] = Field(default_factory=lambda: [])
 
     # === Database ===
     DATABASE_URL: str
@@ -50,6 +52,10 @@ class BaseConfig(BaseSettings):
     DB_SCHEMA: str = "fastapi_users"
     DB_APP_USER: str
     DB_APP_PASSWORD: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
 
     # === Logging ===
     LOG_LEVEL: str = "INFO"
@@ -76,10 +82,28 @@ class BaseConfig(BaseSettings):
     ENABLE_METRICS: bool = True
     ENABLE_HEALTH_CHECKS: bool = True
     ENABLE_SECURITY_HEADERS: bool = True
-
-    class Config:
-        env_file = detect_env_file()
-        case_sensitive = True
+    HEALTH_CACHE_TTL: float = Field(10.0, gt=0)
+    HEALTH_DNS_PROBE_HOST: str = "google.com"
+
+    @field_validator("ALLOWED_ORIGINS")
+    @classmethod
+    def normalize_allowed_origins(cls, v: List[str]) -> List[str]:
+        # CORS compares the raw Origin header, so keep plain "scheme://host[:port]" strings
+        origins = []
+        for origin in v:
+            if origin != "*":
+                scheme, sep, host = origin.partition("://")
+                if not sep or scheme not in ("http", "https") or not host:
+                    raise ValueError(f"Invalid origin in ALLOWED_ORIGINS: {origin!r}")
+            origins.append(origin.rstrip("/"))
+        return origins
+
+    # Settings are read once per process (see get_config) and are immutable afterwards
+    model_config = SettingsConfigDict(
+        env_file=detect_env_file(),
+        case_sensitive=True,
+        frozen=True,
+    )
 
 
 class DevelopmentConfig(BaseConfig):
@@ -97,23 +121,41 @@ class ProductionConfig(BaseConfig):
     DEBUG: bool = False
     LOG_LEVEL: str = "WARNING"
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
-        if not self.SECRET_KEY or self.SECRET_KEY == "your-secret-key-here-change-in-production":
+    @field_validator("SECRET_KEY")
+    @classmethod
+    def validate_secret_key(cls, v: str) -> str:
+        if not v or v == "your-secret-key-here-change-in-production":
             raise ValueError("SECRET_KEY must be set in production!")
-
-        if not self.DATABASE_URL:
-            raise ValueError("DATABASE_URL must be set in production!")
-
-        if len(self.SECRET_KEY) < 32:
+        if len(v) < 32:
             raise ValueError("SECRET_KEY must be at least 32 characters long in production!")
+        return v
+
+    @field_validator("BCRYPT_ROUNDS")
+    @classmethod
+    def validate_bcrypt_rounds(cls, v: int) -> int:
+        if v < 10:
+            raise ValueError("BCRYPT_ROUNDS must be at least 10 in production!")
+        return v
+
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def validate_database_url(cls, v: str) -> str:
+        if not v:
+            raise ValueError("DATABASE_URL must be set in production!")
+        return v
 
-        if self.DEBUG:
+    @field_validator("DEBUG")
+    @classmethod
+    def validate_debug(cls, v: bool) -> bool:
+        if v:
             raise ValueError("DEBUG must be False in production!")
+        return v
 
+    @model_validator(mode="after")
+    def validate_allowed_origins(self) -> "ProductionConfig":
         if "*" in self.ALLOWED_ORIGINS:
             raise ValueError("ALLOWED_ORIGINS must be restricted in production!")
+        return self
 
 
 class TestingConfig(BaseConfig):
@@ -122,19 +164,26 @@ class TestingConfig(BaseConfig):
     LOG_LEVEL: str = "DEBUG"
     DATABASE_URL: str = "sqlite+aiosqlite:///:memory:"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1
+    BCRYPT_ROUNDS: int = Field(4, ge=4, le=31)
     ALLOWED_ORIGINS: List[str] = ["*"]
     GUNICORN_WORKERS: int = 1
 
 
+@lru_cache(maxsize=1)
 def get_config() -> BaseConfig:
-    env = os.getenv("ENVIRONMENT", Environment.DEVELOPMENT.value).lower()
-    config_map = {
-        Environment.DEVELOPMENT.value: DevelopmentConfig,
-        Environment.STAGING.value: StagingConfig,
-        Environment.PRODUCTION.value: ProductionConfig,
-        Environment.TESTING.value: TestingConfig,
-    }
-    return config_map.get(env, DevelopmentConfig)()
-
-
-settings = get_config()
+    match os.getenv("ENVIRONMENT", "development").lower():
+        case "staging":
+            return StagingConfig()
+        case "production":
+            return ProductionConfig()
+        case "testing":
+            return TestingConfig()
+        case _:
+            return DevelopmentConfig()
+
+
+def __getattr__(name: str):
+    # Build ``settings`` lazily on first access; ``get_config`` caches the instance.
+    if name == "settings":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,18 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+import asyncio
 import logging
-from app.db.database import engine
+from sqlalchemy import text
+from app.db.database import engine, health_engine
 from app.models import user
 from app.core.config import settings
+from app.routers.health_router import refresh_health_cache_periodically
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock key shared by all workers so they create the schema one at a time
+SCHEMA_LOCK_ID = 5_020_241
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -17,18 +23,29 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting FastAPI Users API...")
     
     try:
-        # Create database tables
+        # Create database tables. On PostgreSQL workers queue on the lock, so none starts
+        # serving before the tables exist; later holders only run checkfirst lookups.
+        # The transaction-level lock is released on commit.
         async with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                await conn.execute(
+                    text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": SCHEMA_LOCK_ID}
+                )
             await conn.run_sync(user.Base.metadata.create_all)
         logger.info("✅ Database tables created successfully")
         
+        # Keep the detailed health report warm in the background
+        background_tasks = []
+        if settings.ENABLE_HEALTH_CHECKS:
+            background_tasks.append(asyncio.create_task(refresh_health_cache_periodically()))
+        
         # Initialize any other startup tasks here
-        logger.info(f"🌟 Application '{settings.APP_NAME}' started successfully")
-        logger.info(f"🔧 Debug mode: {settings.DEBUG}")
-        logger.info(f"🔐 JWT expiration: {settings.ACCESS_TOKEN_EXPIRE_MINUTES} minutes")
+        logger.info("🌟 Application '%s' started successfully", settings.APP_NAME)
+        logger.info("🔧 Debug mode: %s", settings.DEBUG)
+        logger.info("🔐 JWT expiration: %s minutes", settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         
     except Exception as e:
-        logger.error(f"❌ Error during startup: {e}")
+        logger.error("❌ Error during startup: %s", e)
         raise
     
     # APPLICATION IS RUNNING
@@ -38,13 +55,20 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 Shutting down FastAPI Users API...")
     
     try:
+        # Stop background tasks
+        for task in background_tasks:
+            task.cancel()
+        # Let cancelled tasks unwind before the engines they use are disposed
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        
         # Close database connections
         await engine.dispose()
+        await health_engine.dispose()
         logger.info("✅ Database connections closed")
         
         # Cleanup any other resources here
         logger.info("🏁 Application shutdown completed successfully")
         
     except Exception as e:
-        logger.error(f"❌ Error during shutdown: {e}")
+        logger.error("❌ Error during shutdown: %s", e)
         raise
@@ -1,7 +1,12 @@
+import atexit
 import logging
 import logging.config
+import os
+import queue
 import sys
-from typing import Dict, Any
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Any, Optional
+import orjson
 from app.core.config import settings
 
 class ColoredFormatter(logging.Formatter):
@@ -15,17 +20,47 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m', # Magenta
     }
     RESET = '\033[0m'
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Only emit ANSI codes when writing to a terminal (not docker/journald pipes)
+        self._enabled = sys.stdout.isatty()
+
     def format(self, record):
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        return super().format(record)
+        if not self._enabled or record.levelname not in self.COLORS:
+            return super().format(record)
+
+        # Restore the levelname so other handlers see the record unchanged
+        levelname = record.levelname
+        record.levelname = f"{self.COLORS[levelname]}{levelname}{self.RESET}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+class OrjsonFormatter(logging.Formatter):
+    """Formatter that serializes each record as a single JSON line"""
+
+    def format(self, record):
+        payload = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+DETAILED_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s:%(lineno)d - %(message)s"
+
+def _build_logging_config(debug: bool) -> Dict[str, Any]:
+    """Build the dictConfig schema for development (debug) or production"""
+    log_level = "DEBUG" if debug else "INFO"
 
-def setup_logging() -> None:
-    """Setup logging configuration"""
-    
-    log_level = "DEBUG" if settings.DEBUG else "INFO"
-    
     logging_config: Dict[str, Any] = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -35,7 +70,7 @@ def setup_logging() -> None:
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
             "detailed": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s:%(lineno)d - %(message)s",
+                "format": DETAILED_FORMAT,
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
             "colored": {
@@ -44,7 +79,7 @@ def setup_logging() -> None:
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             },
             "json": {
-                "format": '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "module": "%(module)s", "function": "%(funcName)s", "line": %(lineno)d, "message": "%(message)s"}',
+                "()": OrjsonFormatter,
                 "datefmt": "%Y-%m-%d %H:%M:%S",
             }
         },
@@ -52,25 +87,9 @@ def setup_logging() -> None:
             "console": {
                 "class": "logging.StreamHandler",
                 "level": log_level,
-                "formatter": "colored" if settings.DEBUG else "default",
+                "formatter": "colored" if debug else "default",
                 "stream": sys.stdout,
             },
-            "file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "INFO",
-                "formatter": "detailed",
-                "filename": "logs/app.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
-            },
-            "error_file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "ERROR",
-                "formatter": "detailed",
-                "filename": "logs/error.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
-            }
         },
         "loggers": {
             "": {  # Root logger
@@ -80,7 +99,7 @@ def setup_logging() -> None:
             },
             "app": {
                 "level": log_level,
-                "handlers": ["console", "file"],
+                "handlers": ["console"],
                 "propagate": False,
             },
             "uvicorn": {
@@ -95,43 +114,95 @@ def setup_logging() -> None:
             },
         },
     }
-    
-    # Add file handlers only in production
-    if not settings.DEBUG:
-        logging_config["loggers"][""]["handlers"].extend(["file", "error_file"])
-        logging_config["loggers"]["app"]["handlers"].extend(["error_file"])
-    
+
+    return logging_config
+
+_LOGGING_CONFIG_DEV = _build_logging_config(debug=True)
+_LOGGING_CONFIG_PROD = _build_logging_config(debug=False)
+
+# File output is written by a QueueListener thread, so logging from a request
+# handler only enqueues the record instead of blocking the event loop on disk I/O
+_queue_handler = QueueHandler(queue.Queue(-1))
+_queue_listener: Optional[QueueListener] = None
+
+def _build_file_handler(filename: str, level: int) -> logging.Handler:
+    """Create a rotating file handler drained by the queue listener"""
+    handler = RotatingFileHandler(filename, maxBytes=10485760, backupCount=5)  # 10MB
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter(DETAILED_FORMAT, datefmt="%Y-%m-%d %H:%M:%S"))
+    return handler
+
+def _start_queue_listener(*handlers: logging.Handler) -> None:
+    """Start a listener thread writing queued records to the given handlers"""
+    global _queue_listener
+    _queue_handler.queue = queue.Queue(-1)
+    _queue_listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+def _stop_queue_listener() -> None:
+    """Flush pending records and close the file handlers"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+def _restart_queue_listener_after_fork() -> None:
+    """Threads do not survive fork(); give each forked worker its own listener"""
+    if _queue_listener is not None:
+        _start_queue_listener(*_queue_listener.handlers)
+
+atexit.register(_stop_queue_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_queue_listener_after_fork)
+
+def setup_logging() -> None:
+    """Setup logging configuration"""
     # Create logs directory
-    import os
     os.makedirs("logs", exist_ok=True)
-    
-    logging.config.dictConfig(logging_config)
+
+    _stop_queue_listener()
+    logging.config.dictConfig(_LOGGING_CONFIG_DEV if settings.DEBUG else _LOGGING_CONFIG_PROD)
+
+    # File logging: "app" records always, everything else only in production
+    logging.getLogger("app").addHandler(_queue_handler)
+    if not settings.DEBUG:
+        logging.getLogger().addHandler(_queue_handler)
+
+    _start_queue_listener(
+        _build_file_handler("logs/app.log", logging.INFO),
+        _build_file_handler("logs/error.log", logging.ERROR),
+    )
 
 # Create logger instance
 logger = logging.getLogger("app")
 
 # Utility functions for structured logging
-def log_request(method: str, path: str, status_code: int, duration: float):
+def log_request(method: str, path: str, status_code: int, duration: float, request_id: str = None):
     """Log HTTP request"""
-    logger.info(f"HTTP {method} {path} - {status_code} - {duration:.3f}s")
+    if request_id:
+        logger.info("[%s] HTTP %s %s - %d - %.3fs", request_id, method, path, status_code, duration)
+    else:
+        logger.info("HTTP %s %s - %d - %.3fs", method, path, status_code, duration)
 
 def log_database_operation(operation: str, table: str, duration: float = None):
     """Log database operation"""
     if duration:
-        logger.debug(f"DB {operation} on {table} - {duration:.3f}s")
+        logger.debug("DB %s on %s - %.3fs", operation, table, duration)
     else:
-        logger.debug(f"DB {operation} on {table}")
+        logger.debug("DB %s on %s", operation, table)
 
 def log_authentication(email: str, success: bool, reason: str = None):
     """Log authentication attempt"""
     if success:
-        logger.info(f"Authentication successful for {email}")
+        logger.info("Authentication successful for %s", email)
     else:
-        logger.warning(f"Authentication failed for {email}: {reason}")
+        logger.warning("Authentication failed for %s: %s", email, reason)
 
 def log_error(error: Exception, context: str = None):
     """Log error with context"""
     if context:
-        logger.error(f"Error in {context}: {str(error)}", exc_info=True)
+        logger.error("Error in %s: %s", context, error, exc_info=True)
     else:
-        logger.error(f"Error: {str(error)}", exc_info=True)
+        logger.error("Error: %s", error, exc_info=True)
@@ -1,74 +1,125 @@
+import logging
+import os
 import time
-import uuid
-import re
+from typing import Dict
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from app.core.logging_config import logger, log_request
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging HTTP requests and responses"""
     
     async def dispatch(self, request: Request, call_next):
-        request_id = str(uuid.uuid4())
+        request_id = os.urandom(16).hex()
         request.state.request_id = request_id
-        start_time = time.time()
+        method = request.method
+        path = request.url.path
+        start_time = time.perf_counter()
+
+        # Start trace only when debugging; the completion log carries the same fields
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] %s %s - Started", request_id, method, path)
 
-        logger.info(f"[{request_id}] {request.method} {request.url.path} - Started")
-        
         try:
             response = await call_next(request)
-            duration = time.time() - start_time
-
-            log_request(
-                method=request.method,
-                path=str(request.url.path),
-                status_code=response.status_code,
-                duration=duration
-            )
-
-            logger.info(
-                f"[{request_id}] {request.method} {request.url.path} - "
-                f"Completed {response.status_code} in {duration:.3f}s"
-            )
-
-            response.headers["X-Request-ID"] = request_id
-            return response
-
         except Exception as e:
-            duration = time.time() - start_time
             logger.error(
-                f"[{request_id}] {request.method} {request.url.path} - "
-                f"Failed in {duration:.3f}s: {str(e)}"
+                "[%s] %s %s - Failed in %.3fs: %s",
+                request_id, method, path,
+                time.perf_counter() - start_time, e
             )
             raise
 
+        log_request(
+            method=method,
+            path=path,
+            status_code=response.status_code,
+            duration=time.perf_counter() - start_time,
+            request_id=request_id
+        )
+
+        response.headers["X-Request-ID"] = request_id
+        return response
+
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Middleware for adding security headers"""
 
+    DOCS_PATH_PREFIXES = ("/docs", "/redoc", "/openapi.json")
+
     def __init__(self, app):
         super().__init__(app)
-        self.docs_path_pattern = re.compile(r"^/(docs|redoc|openapi.json)")
+
+        # Headers comunes, codificados una sola vez
+        self._static_headers = [
+            (b"x-content-type-options", b"nosniff"),
+            (b"x-frame-options", b"DENY"),
+            (b"x-xss-protection", b"1; mode=block"),
+            (b"referrer-policy", b"strict-origin-when-cross-origin"),
+        ]
+
+        # Swagger docs: permitir scripts inline (por requerimientos de Swagger UI)
+        self._docs_csp = (
+            b"content-security-policy",
+            b"default-src 'self'; "
+            b"script-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
+            b"style-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
+            b"img-src 'self' data: https://fastapi.tiangolo.com; "
+            b"font-src 'self' https://cdn.jsdelivr.net;",
+        )
+        # Política más estricta para todo lo demás
+        self._default_csp = (b"content-security-policy", b"default-src 'self'")
 
     async def dispatch(self, request: Request, call_next):
         response: Response = await call_next(request)
 
-        # Headers comunes
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        raw_headers = response.raw_headers
+        raw_headers.extend(self._static_headers)
 
-        # Swagger docs: permitir scripts inline (por requerimientos de Swagger UI)
-        if self.docs_path_pattern.match(str(request.url.path)):
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
-                "style-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
-                "img-src 'self' data: https://fastapi.tiangolo.com; "
-                "font-src 'self' https://cdn.jsdelivr.net;"
-            )
+        if request.url.path.startswith(self.DOCS_PATH_PREFIXES):
+            raw_headers.append(self._docs_csp)
         else:
-            # Política más estricta para todo lo demás
-            response.headers["Content-Security-Policy"] = "default-src 'self'"
+            raw_headers.append(self._default_csp)
 
         return response
+
+class HealthCheckInterceptor:
+    """ASGI wrapper that answers static health probes before any middleware runs"""
+
+    ALLOWED_METHODS = ("GET", "HEAD")
+
+    def __init__(self, app: ASGIApp, responses: Dict[str, bytes]):
+        self.app = app
+        # Pre-build the response headers once per probe path
+        self.responses = {
+            path: (
+                [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"cache-control", b"no-store"),
+                ],
+                body,
+            )
+            for path, body in responses.items()
+        }
+        self._not_allowed_body = b'{"detail":"Method Not Allowed"}'
+        self._not_allowed_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._not_allowed_body)).encode()),
+            (b"allow", ", ".join(self.ALLOWED_METHODS).encode()),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response = self.responses.get(scope["path"]) if scope["type"] == "http" else None
+        if response is None:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method not in self.ALLOWED_METHODS:
+            status_code, headers, body = 405, self._not_allowed_headers, self._not_allowed_body
+        else:
+            status_code, (headers, body) = 200, response
+
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body if method != "HEAD" else b""})
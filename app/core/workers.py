@@ -0,0 +1,11 @@
+from uvicorn.workers import UvicornWorker
+
+
+class TunedUvicornWorker(UvicornWorker):
+    """Uvicorn worker pinned to the uvloop event loop and the httptools parser.
+
+    Both ship with uvicorn[standard]; pinning them makes a missing extension fail
+    at worker boot instead of silently falling back to asyncio and h11.
+    """
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
@@ -1,12 +1,50 @@
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+# Pool sizing and TCP keepalives only apply to PostgreSQL; SQLite uses its own pool classes
+engine_options = {}
+if make_url(settings.DATABASE_URL).get_backend_name() == "postgresql":
+    engine_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "connect_args": {
+            "server_settings": {"tcp_keepalives_idle": "30", "tcp_keepalives_interval": "10"},
+            # Reuse server-side prepared statements for repeated queries
+            "prepared_statement_cache_size": 1024,
+            "statement_cache_size": 1024,
+        },
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    pool_pre_ping=True,  # Detect connections dropped by the server before using them
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    **engine_options
+)
+
+# Dedicated single-connection engine for health probes, so frequent probes neither
+# open new connections nor compete with requests for the main pool
+health_engine_options = {}
+if engine_options:
+    health_engine_options = {
+        "pool_size": 1,
+        "max_overflow": 0,
+        "pool_timeout": 2,
+        "connect_args": engine_options["connect_args"],
+    }
+
+health_engine = create_async_engine(
+    settings.DATABASE_URL,
+    future=True,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    **health_engine_options
 )
 
 # Create async session factory
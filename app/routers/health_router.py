@@ -1,31 +1,169 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, Response, status
 from sqlalchemy import text
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+import os
+import math
 import time
+import struct
 import psutil
 import asyncio
-from app.db.database import get_db
+import socket
+import orjson
+from app.db.database import health_engine
+from app.core.config import settings
 from app.core.logging_config import logger
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; system metrics are then cached per process
+    fcntl = None
+
 router = APIRouter()
 
+class HealthCache:
+    """Keeps the last detailed health report for a short TTL"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.value: Optional[Dict[str, Any]] = None
+        self.expires_at = 0.0
+        self.lock = asyncio.Lock()
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """Return the cached report, or None if it is missing or expired"""
+        if time.monotonic() < self.expires_at:
+            return self.value
+        return None
+
+    def set(self, value: Dict[str, Any]) -> None:
+        self.value = value
+        self.expires_at = time.monotonic() + self.ttl
+
+health_cache = HealthCache(ttl=settings.HEALTH_CACHE_TTL)
+
+# psutil.cpu_percent(interval=None) reports usage since its previous call without
+# sleeping. The import-time call only primes it: its reading covers the app's own
+# import work, so no CPU value is reported until CPU_SAMPLE_INTERVAL has passed
+CPU_SAMPLE_INTERVAL = 2.0
+SYSTEM_SNAPSHOT_TTL = 30
+psutil.cpu_percent(interval=None)
+_cpu_sample: Tuple[float, Optional[float]] = (time.monotonic(), None)
+
+def _get_cpu_percent() -> Optional[float]:
+    """Return the latest CPU sample, or None while only the import-time primer exists"""
+    global _cpu_sample
+    sampled_at, cpu_percent = _cpu_sample
+    if time.monotonic() - sampled_at >= CPU_SAMPLE_INTERVAL:
+        _cpu_sample = (time.monotonic(), psutil.cpu_percent(interval=None))
+        cpu_percent = _cpu_sample[1]
+    return cpu_percent
+
+@lru_cache(maxsize=1)
+def _system_snapshot(time_bucket: int) -> Tuple[Any, Any]:
+    """Memory and root disk usage, cached per SYSTEM_SNAPSHOT_TTL-second time bucket"""
+    return psutil.virtual_memory(), psutil.disk_usage('/')
+
+# System-wide usage is shared between gunicorn workers through a small file on
+# /dev/shm, so only one worker samples psutil per SHARED_METRICS_TTL seconds.
+# The record keeps cumulative CPU busy/total seconds so the refreshing worker
+# derives CPU usage from the previous shared sample, not its own psutil state
+SHARED_METRICS_PATH = "/dev/shm/fastapi_users_health_sys"
+SHARED_METRICS_TTL = 5.0
+# sampled_at, cpu busy, cpu total, cpu (NaN if unknown), memory, disk percent
+_SHARED_METRICS = struct.Struct("<dddddd")
+_shared_metrics_fd: Optional[Tuple[int, int]] = None
+
+def _cpu_times_totals() -> Tuple[float, float]:
+    """Cumulative system-wide CPU busy and total seconds, counted the way psutil.cpu_percent does"""
+    times = psutil.cpu_times()
+    # Guest time is already included in user/nice time on Linux
+    total = sum(times) - getattr(times, "guest", 0.0) - getattr(times, "guest_nice", 0.0)
+    busy = total - times.idle - getattr(times, "iowait", 0.0)
+    return busy, total
+
+def _sample_system_percents() -> Tuple[Optional[float], float, float]:
+    """CPU, memory and disk usage percentages from this process's own caches"""
+    memory, disk = _system_snapshot(int(time.monotonic() // SYSTEM_SNAPSHOT_TTL))
+    return _get_cpu_percent(), memory.percent, disk.percent
+
+def _read_shared_metrics(fd: int) -> Optional[Tuple[float, float, float, Optional[float], float, float]]:
+    """Unpack the shared record, or None if it has not been written yet"""
+    data = os.pread(fd, _SHARED_METRICS.size, 0)
+    if len(data) != _SHARED_METRICS.size:
+        return None
+    sampled_at, busy, total, cpu_percent, memory_percent, disk_percent = _SHARED_METRICS.unpack(data)
+    return sampled_at, busy, total, None if math.isnan(cpu_percent) else cpu_percent, memory_percent, disk_percent
+
+def _get_system_percents() -> Tuple[Optional[float], float, float]:
+    """CPU, memory and disk usage percentages, read from the cross-worker cache when possible"""
+    global _shared_metrics_fd
+    if fcntl is None:
+        return _sample_system_percents()
+    try:
+        # Opened per process: a descriptor inherited across fork would share its flock
+        if _shared_metrics_fd is None or _shared_metrics_fd[0] != os.getpid():
+            _shared_metrics_fd = (os.getpid(), os.open(SHARED_METRICS_PATH, os.O_RDWR | os.O_CREAT, 0o600))
+        fd = _shared_metrics_fd[1]
+        
+        record = _read_shared_metrics(fd)
+        if record and time.time() - record[0] <= SHARED_METRICS_TTL:
+            return record[3:]
+        
+        # Stale: one worker refreshes, the others keep serving the previous values
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return record[3:] if record else _sample_system_percents()
+        try:
+            # Another worker may have refreshed between the read and the lock
+            record = _read_shared_metrics(fd)
+            if record and time.time() - record[0] <= SHARED_METRICS_TTL:
+                return record[3:]
+            
+            busy, total = _cpu_times_totals()
+            cpu_percent = None
+            if record and total > record[2]:
+                cpu_percent = round(min(100.0, max(0.0, (busy - record[1]) / (total - record[2]) * 100)), 1)
+            memory, disk = _system_snapshot(int(time.monotonic() // SYSTEM_SNAPSHOT_TTL))
+            cpu_field = math.nan if cpu_percent is None else cpu_percent
+            os.pwrite(fd, _SHARED_METRICS.pack(time.time(), busy, total, cpu_field, memory.percent, disk.percent), 0)
+            return cpu_percent, memory.percent, disk.percent
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    except OSError:
+        return _sample_system_percents()
+
+# Timeout for the database connectivity probe
+DB_CHECK_TIMEOUT = 2.0
+
+async def _ping_database() -> None:
+    """Run SELECT 1 on the dedicated health engine's single pooled connection"""
+    async with health_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+# Successful DNS lookups are remembered so frequent probes do not hit the resolver
+DNS_CHECK_TIMEOUT = 1.0
+DNS_CACHE_TTL = 60.0
+_dns_cache: Dict[str, float] = {}  # host -> expires_at
+
+async def _resolve_host(host: str) -> None:
+    """Resolve host in a worker thread, skipping the lookup while a recent success is cached"""
+    if time.monotonic() < _dns_cache.get(host, 0.0):
+        return
+    await asyncio.wait_for(asyncio.to_thread(socket.getaddrinfo, host, None), timeout=DNS_CHECK_TIMEOUT)
+    _dns_cache[host] = time.monotonic() + DNS_CACHE_TTL
+
 class HealthChecker:
     """Health check utilities for monitoring system components"""
     
     @staticmethod
-    async def check_database(db: AsyncSession) -> Dict[str, Any]:
+    async def check_database() -> Dict[str, Any]:
         """Check database connectivity and performance"""
         start_time = time.time()
         try:
-            # Simple query to test connection
-            result = await db.execute(text("SELECT 1"))
-            result.fetchone()
-            
-            # Test write capability
-            await db.execute(text("CREATE TEMP TABLE health_check (id INTEGER)"))
-            await db.execute(text("INSERT INTO health_check (id) VALUES (1)"))
-            await db.execute(text("DROP TABLE health_check"))
+            # Single cheap round-trip; dead pooled connections are handled by pool_pre_ping
+            await asyncio.wait_for(_ping_database(), timeout=DB_CHECK_TIMEOUT)
             
             duration = time.time() - start_time
             
@@ -34,6 +172,14 @@ class HealthChecker:
                 "response_time_ms": round(duration * 1000, 2),
                 "message": "Database connection successful"
             }
+        except asyncio.TimeoutError:
+            duration = time.time() - start_time
+            logger.error("Database health check timed out after %ss", DB_CHECK_TIMEOUT)
+            return {
+                "status": "unhealthy",
+                "response_time_ms": round(duration * 1000, 2),
+                "message": f"Database did not respond within {DB_CHECK_TIMEOUT}s"
+            }
         except Exception as e:
             duration = time.time() - start_time
             logger.error(f"Database health check failed: {e}")
@@ -47,9 +193,7 @@ class HealthChecker:
     def check_system_resources() -> Dict[str, Any]:
         """Check system resource usage"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            cpu_percent, memory_percent, disk_percent = _get_system_percents()
             
             # Define thresholds
             cpu_threshold = 80.0
@@ -59,23 +203,24 @@ class HealthChecker:
             status = "healthy"
             issues = []
             
-            if cpu_percent > cpu_threshold:
+            # cpu_percent is None until a real sample exists; it is reported but not judged
+            if cpu_percent is not None and cpu_percent > cpu_threshold:
                 status = "degraded"
                 issues.append(f"High CPU usage: {cpu_percent}%")
             
-            if memory.percent > memory_threshold:
+            if memory_percent > memory_threshold:
                 status = "degraded"
-                issues.append(f"High memory usage: {memory.percent}%")
+                issues.append(f"High memory usage: {memory_percent}%")
             
-            if disk.percent > disk_threshold:
+            if disk_percent > disk_threshold:
                 status = "unhealthy"
-                issues.append(f"High disk usage: {disk.percent}%")
+                issues.append(f"High disk usage: {disk_percent}%")
             
             return {
                 "status": status,
                 "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "disk_percent": disk.percent,
+                "memory_percent": memory_percent,
+                "disk_percent": disk_percent,
                 "issues": issues,
                 "message": "System resources checked" if not issues else "; ".join(issues)
             }
@@ -96,14 +241,21 @@ class HealthChecker:
         overall_status = "healthy"
         
         # Example: Check if we can resolve DNS
+        host = settings.HEALTH_DNS_PROBE_HOST
         try:
-            import socket
-            socket.gethostbyname('google.com')
+            await _resolve_host(host)
             checks.append({
                 "service": "DNS Resolution",
                 "status": "healthy",
-                "message": "DNS resolution working"
+                "message": f"DNS resolution working for {host}"
             })
+        except asyncio.TimeoutError:
+            checks.append({
+                "service": "DNS Resolution",
+                "status": "unhealthy",
+                "message": f"DNS resolution for {host} timed out after {DNS_CHECK_TIMEOUT}s"
+            })
+            overall_status = "degraded"
         except Exception as e:
             checks.append({
                 "service": "DNS Resolution",
@@ -127,28 +279,44 @@ async def basic_health_check():
         "timestamp": time.time()
     }
 
-@router.get("/health/detailed", tags=["Health"])
-async def detailed_health_check(db: AsyncSession = Depends(get_db)):
-    """Detailed health check with all system components"""
+# Upper bound for each component check so one slow dependency cannot stall the probe
+HEALTH_CHECK_TIMEOUT = 5.0
+
+def _as_check_result(component: str, result: Any) -> Dict[str, Any]:
+    """Turn a timeout or exception raised by a component check into an unhealthy result"""
+    if isinstance(result, asyncio.TimeoutError):
+        logger.error("%s health check timed out after %ss", component, HEALTH_CHECK_TIMEOUT)
+        return {"status": "unhealthy", "message": f"{component} check timed out"}
+    if isinstance(result, BaseException):
+        logger.error("%s health check failed: %s", component, result)
+        return {"status": "unhealthy", "message": f"{component} check error: {str(result)}"}
+    return result
+
+async def build_health_report() -> Dict[str, Any]:
+    """Run all health checks and build the detailed report"""
     start_time = time.time()
     
-    # Run all health checks
-    db_health = await HealthChecker.check_database(db)
-    system_health = HealthChecker.check_system_resources()
-    external_health = await HealthChecker.check_external_dependencies()
+    # Run all health checks concurrently (the system check is sync, so run it in a thread)
+    results = await asyncio.gather(
+        asyncio.wait_for(HealthChecker.check_database(), HEALTH_CHECK_TIMEOUT),
+        asyncio.wait_for(asyncio.to_thread(HealthChecker.check_system_resources), HEALTH_CHECK_TIMEOUT),
+        asyncio.wait_for(HealthChecker.check_external_dependencies(), HEALTH_CHECK_TIMEOUT),
+        return_exceptions=True,
+    )
+    db_health, system_health, external_health = (
+        _as_check_result(component, result)
+        for component, result in zip(("Database", "System", "External"), results)
+    )
     
     # Determine overall status
     statuses = [db_health["status"], system_health["status"], external_health["status"]]
     
     if "unhealthy" in statuses:
         overall_status = "unhealthy"
-        status_code = status.HTTP_503_SERVICE_UNAVAILABLE
     elif "degraded" in statuses:
         overall_status = "degraded"
-        status_code = status.HTTP_200_OK
     else:
         overall_status = "healthy"
-        status_code = status.HTTP_200_OK
     
     total_duration = time.time() - start_time
     
@@ -163,25 +331,64 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)):
         }
     }
     
-    # Log health check results
-    if overall_status == "unhealthy":
-        logger.error(f"Health check failed: {health_report}")
-    elif overall_status == "degraded":
-        logger.warning(f"Health check degraded: {health_report}")
-    else:
-        logger.debug(f"Health check passed: {overall_status}")
+    # Built every HEALTH_CACHE_TTL seconds; status changes are logged by the refresh task
+    logger.debug("Health check %s: %s", overall_status, health_report)
+    
+    return health_report
+
+# Minimum pause between background refreshes, even when a build outlasts the TTL
+HEALTH_REFRESH_MIN_INTERVAL = 1.0
+
+async def refresh_health_cache_periodically() -> None:
+    """Background task keeping the cached health report fresh between requests"""
+    last_status = "healthy"
+    while True:
+        started = time.monotonic()
+        try:
+            async with health_cache.lock:
+                health_report = await build_health_report()
+                health_cache.set(health_report)
+            # Only transitions are logged, not every refresh
+            if health_report["status"] != last_status:
+                if health_report["status"] == "unhealthy":
+                    logger.error("Health check failed: %s", health_report)
+                elif health_report["status"] == "degraded":
+                    logger.warning("Health check degraded: %s", health_report)
+                else:
+                    logger.info("Health check recovered: %s", health_report["status"])
+                last_status = health_report["status"]
+        except Exception as e:
+            logger.error("Health cache refresh failed: %s", e)
+        # Start the next refresh before the current report expires
+        elapsed = time.monotonic() - started
+        await asyncio.sleep(max(HEALTH_REFRESH_MIN_INTERVAL, health_cache.ttl - elapsed))
+
+@router.get("/health/detailed", tags=["Health"])
+async def detailed_health_check():
+    """Detailed health check with all system components"""
+    health_report = health_cache.get()
+    if health_report is None and health_cache.lock.locked() and health_cache.value is not None:
+        # A refresh is already running; serve the previous report instead of waiting
+        health_report = health_cache.value
+    if health_report is None:
+        async with health_cache.lock:
+            # Another request may have refreshed the report while we waited
+            health_report = health_cache.get()
+            if health_report is None:
+                health_report = await build_health_report()
+                health_cache.set(health_report)
     
-    if status_code != status.HTTP_200_OK:
-        raise HTTPException(status_code=status_code, detail=health_report)
+    if health_report["status"] == "unhealthy":
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=health_report)
     
     return health_report
 
 @router.get("/health/ready", tags=["Health"])
-async def readiness_check(db: AsyncSession = Depends(get_db)):
+async def readiness_check():
     """Kubernetes readiness probe endpoint"""
     try:
         # Check if application is ready to serve traffic
-        db_health = await HealthChecker.check_database(db)
+        db_health = await HealthChecker.check_database()
         
         if db_health["status"] != "healthy":
             raise HTTPException(
@@ -198,9 +405,10 @@ async def readiness_check(db: AsyncSession = Depends(get_db)):
             detail="Application not ready"
         )
 
+# Static liveness body; normally served by HealthCheckInterceptor before routing
+LIVE_BODY = orjson.dumps({"status": "alive", "message": "Application is alive"})
+
 @router.get("/health/live", tags=["Health"])
 async def liveness_check():
     """Kubernetes liveness probe endpoint"""
-    # Simple check to verify the application is alive
-    # This should be lightweight and not check external dependencies
-    return {"status": "alive", "message": "Application is alive"}
+    return Response(content=LIVE_BODY, media_type="application/json", headers={"cache-control": "no-store"})
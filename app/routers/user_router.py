@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.db.database import get_db
@@ -8,6 +9,9 @@ from app.core.security import get_current_user
 
 router = APIRouter()
 
+# Validates and serializes a whole page of users in one pass
+_users_adapter = TypeAdapter(List[UserResponse])
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
@@ -46,7 +50,11 @@ async def get_users(
     current_user: dict = Depends(get_current_user)
 ):
     """Get all users (requires authentication)"""
-    return await UserService.get_users(db, skip=skip, limit=limit)
+    users = await UserService.get_users(db, skip=skip, limit=limit)
+    return Response(
+        content=_users_adapter.dump_json(_users_adapter.validate_python(users, from_attributes=True)),
+        media_type="application/json"
+    )
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
@@ -1,6 +1,19 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr
+from typing import Annotated, Optional
 from datetime import datetime
+import re
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+def _validate_fast_email(value: str) -> str:
+    """Cheap syntactic email check; lowercases the domain like EmailStr does"""
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+# Lightweight email type for hot paths that only look an existing address up
+FastEmail = Annotated[str, AfterValidator(_validate_fast_email)]
 
 # Base user schema
 class UserBase(BaseModel):
@@ -27,12 +40,11 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Schema for user login
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: FastEmail
     password: str
 
 # Schema for token response
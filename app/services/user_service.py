@@ -1,21 +1,42 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import bindparam, delete as sa_delete, update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user_schema import UserCreate, UserUpdate
 from app.core.security import hash_password, verify_password
 from app.utils.jwt import create_access_token
+from dataclasses import dataclass
 from typing import Optional, List
 
+# Dialect-specific INSERT constructs that support ON CONFLICT
+INSERT_BY_DIALECT = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Read statements are built once; only the bound values change per call
+_select_user_by_email = select(User).where(User.email == bindparam("email"))
+_select_auth_user_by_email = select(
+    User.id, User.email, User.hashed_password, User.is_active
+).where(User.email == bindparam("email"))
+_select_users_page = select(User).offset(bindparam("skip")).limit(bindparam("limit"))
+
+@dataclass(frozen=True)
+class AuthUser:
+    """Columns needed to authenticate a user, loaded without ORM hydration"""
+    id: int
+    email: str
+    hashed_password: str
+    is_active: bool
+
 class UserService:
     
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
-        """Create a new user"""
+        """Create a new user, skipping the insert if the email or username is taken"""
         hashed_password = hash_password(user_data.password)
-        
-        db_user = User(
+        values = dict(
             email=user_data.email,
             username=user_data.username,
             hashed_password=hashed_password,
@@ -23,66 +44,82 @@ class UserService:
             is_superuser=user_data.is_superuser
         )
         
-        try:
-            db.add(db_user)
-            await db.commit()
-            await db.refresh(db_user)
-            return db_user
-        except IntegrityError:
-            await db.rollback()
+        insert = INSERT_BY_DIALECT.get(db.get_bind(User).dialect.name)
+        if insert is None:
+            # No ON CONFLICT support: insert optimistically and map the constraint violation
+            db_user = User(**values)
+            try:
+                db.add(db_user)
+                await db.commit()
+                await db.refresh(db_user)
+                return db_user
+            except IntegrityError:
+                await db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email or username already registered"
+                )
+        
+        result = await db.execute(
+            insert(User).values(**values).on_conflict_do_nothing().returning(User)
+        )
+        db_user = result.scalar_one_or_none()
+        await db.commit()
+        
+        if db_user is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email or username already registered"
             )
+        return db_user
     
     @staticmethod
-    async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[AuthUser]:
         """Authenticate user with email and password"""
-        result = await db.execute(select(User).where(User.email == email))
-        user = result.scalar_one_or_none()
+        result = await db.execute(_select_auth_user_by_email, {"email": email})
+        row = result.one_or_none()
         
-        if not user or not verify_password(password, user.hashed_password):
+        if not row or not verify_password(password, row.hashed_password):
             return None
-        return user
+        return AuthUser(*row)
     
     @staticmethod
     async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
-        """Get user by ID"""
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        """Get user by ID, served from the session identity map when already loaded"""
+        return await db.get(User, user_id)
     
     @staticmethod
     async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """Get user by email"""
-        result = await db.execute(select(User).where(User.email == email))
+        result = await db.execute(_select_user_by_email, {"email": email})
         return result.scalar_one_or_none()
     
     @staticmethod
     async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all users with pagination"""
-        result = await db.execute(select(User).offset(skip).limit(limit))
+        result = await db.execute(_select_users_page, {"skip": skip, "limit": limit})
         return result.scalars().all()
     
     @staticmethod
     async def update_user(db: AsyncSession, user_id: int, user_data: UserUpdate) -> Optional[User]:
-        """Update user"""
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            return None
-        
-        update_data = user_data.dict(exclude_unset=True)
+        """Update user in a single UPDATE ... RETURNING statement"""
+        update_data = user_data.model_dump(exclude_unset=True)
         
         if "password" in update_data:
             update_data["hashed_password"] = hash_password(update_data.pop("password"))
         
-        for field, value in update_data.items():
-            setattr(user, field, value)
+        if not update_data:
+            return await UserService.get_user_by_id(db, user_id)
         
         try:
+            # Loading the RETURNING row through select().from_statement() lets populate_existing
+            # refresh a User already in the identity map (ORM UPDATE ignores that option)
+            stmt = sa_update(User).where(User.id == user_id).values(**update_data).returning(User)
+            result = await db.execute(
+                select(User).from_statement(stmt).execution_options(populate_existing=True)
+            )
+            user = result.scalar_one_or_none()
             await db.commit()
-            await db.refresh(user)
             return user
         except IntegrityError:
             await db.rollback()
@@ -93,16 +130,12 @@ class UserService:
     
     @staticmethod
     async def delete_user(db: AsyncSession, user_id: int) -> bool:
-        """Delete user"""
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
-        
-        if not user:
-            return False
-        
-        await db.delete(user)
+        """Delete user in a single DELETE statement"""
+        # Default session synchronization evicts the deleted User from the identity map,
+        # so a later db.get() does not return it
+        result = await db.execute(sa_delete(User).where(User.id == user_id))
         await db.commit()
-        return True
+        return result.rowcount > 0
     
     @staticmethod
     async def login_user(db: AsyncSession, email: str, password: str) -> dict:
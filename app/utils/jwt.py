@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+import time
 from jose import JWTError, jwt
 from app.core.config import settings
 
@@ -15,13 +17,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> Tuple[str, float]:
+    """Verify the token signature once and return its (sub, exp) claims.
+
+    Invalid tokens raise JWTError, which lru_cache does not store, so garbage
+    tokens cannot evict valid ones from the cache.
+    """
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    email = payload.get("sub")
+    if email is None:
+        raise JWTError("Token has no subject")
+    return email, payload.get("exp", float("inf"))
+
 def verify_token(token: str) -> Optional[dict]:
     """Verify JWT token and return payload"""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            return None
-        return {"sub": email}
+        email, expires_at = _decode_token(token)
     except JWTError:
         return None
+    # The signature check is cached, so expiry must be re-checked on every call
+    if expires_at <= time.time():
+        return None
+    return {"sub": email}
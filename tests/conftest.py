@@ -1,48 +1,71 @@
+import os
 import pytest
 import asyncio
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from app.main import app
+from sqlalchemy.pool import StaticPool
+
+# Cheap password hashing for the suite; must be set before the settings are loaded
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from app.main import app, fastapi_app
 from app.db.database import get_db
 from app.db.base import Base
 from app.core.config import settings
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Test database URL: one shared in-memory database for the whole session
+TEST_DATABASE_URL = "sqlite+aiosqlite:///file::memory:?cache=shared&uri=true"
 
 # Create test engine
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
-    future=True
+    future=True,
+    poolclass=StaticPool
 )
 
-# Create test session factory
-TestSessionLocal = sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+# pysqlite/aiosqlite manage transactions themselves and break SAVEPOINT;
+# let SQLAlchemy emit BEGIN so each test can roll back its own transaction
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 @pytest.fixture(scope="session")
-async def event_loop():
+def event_loop():
     """Create an instance of the default event loop for the test session."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
-@pytest.fixture
-async def db_session():
-    """Create a test database session."""
+@pytest.fixture(scope="session")
+async def database():
+    """Create the schema once for the test session."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
-    async with TestSessionLocal() as session:
-        yield session
-    
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    yield test_engine
+    await test_engine.dispose()
+
+@pytest.fixture
+async def db_session(database):
+    """Create a test database session rolled back after each test."""
+    async with database.connect() as conn:
+        trans = await conn.begin()
+        # Commits inside the app release a SAVEPOINT instead of the outer transaction
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
 
 @pytest.fixture
 async def client(db_session):
@@ -50,12 +73,12 @@ async def client(db_session):
     async def override_get_db():
         yield db_session
     
-    app.dependency_overrides[get_db] = override_get_db
+    fastapi_app.dependency_overrides[get_db] = override_get_db
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
     
-    app.dependency_overrides.clear()
+    fastapi_app.dependency_overrides.clear()
 
 @pytest.fixture
 async def auth_headers(client: AsyncClient):
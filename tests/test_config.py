@@ -0,0 +1,63 @@
+import pytest
+from pydantic import ValidationError
+from app.core.config import ProductionConfig
+
+VALID_PRODUCTION_SETTINGS = {
+    "SECRET_KEY": "x" * 32,
+    "DATABASE_URL": "postgresql+asyncpg://user:password@db:5432/app",
+    "DB_HOST": "db",
+    "DB_NAME": "app",
+    "DB_USER": "user",
+    "DB_PASSWORD": "password",
+    "DB_APP_USER": "app_user",
+    "DB_APP_PASSWORD": "app_password",
+    "DEBUG": False,
+    "BCRYPT_ROUNDS": 12,
+    "ALLOWED_ORIGINS": ["https://app.example.com"],
+}
+
+def make_production_config(**overrides) -> ProductionConfig:
+    """Build a ProductionConfig from explicit values only, ignoring any env file"""
+    return ProductionConfig(_env_file=None, **{**VALID_PRODUCTION_SETTINGS, **overrides})
+
+class TestProductionConfig:
+
+    def test_valid_settings(self):
+        """Test a complete production configuration is accepted"""
+        config = make_production_config()
+        assert config.ALLOWED_ORIGINS == ["https://app.example.com"]
+
+    @pytest.mark.parametrize(
+        "overrides, message",
+        [
+            ({"SECRET_KEY": "too-short"}, "at least 32 characters"),
+            ({"SECRET_KEY": "your-secret-key-here-change-in-production"}, "SECRET_KEY must be set"),
+            ({"DEBUG": True}, "DEBUG must be False"),
+            ({"BCRYPT_ROUNDS": 4}, "BCRYPT_ROUNDS must be at least 10"),
+            ({"BCRYPT_ROUNDS": 32}, "less than or equal to 31"),
+            ({"ALLOWED_ORIGINS": ["*"]}, "ALLOWED_ORIGINS must be restricted"),
+        ],
+    )
+    def test_rejects_unsafe_settings(self, overrides, message):
+        """Test unsafe production settings fail at startup"""
+        with pytest.raises(ValidationError, match=message):
+            make_production_config(**overrides)
+
+class TestAllowedOrigins:
+
+    @pytest.mark.parametrize(
+        "origins, expected",
+        [
+            (["https://app.example.com/"], ["https://app.example.com"]),
+            (["http://localhost:3000", "https://app.example.com"], ["http://localhost:3000", "https://app.example.com"]),
+        ],
+    )
+    def test_normalizes_origins(self, origins, expected):
+        """Test origins are kept as scheme://host[:port] without a trailing slash"""
+        assert make_production_config(ALLOWED_ORIGINS=origins).ALLOWED_ORIGINS == expected
+
+    @pytest.mark.parametrize("origin", ["ftp://files.example.com", "app.example.com", "https://"])
+    def test_rejects_invalid_origins(self, origin):
+        """Test non-http(s) or malformed origins are rejected"""
+        with pytest.raises(ValidationError, match="Invalid origin in ALLOWED_ORIGINS"):
+            make_production_config(ALLOWED_ORIGINS=[origin])
@@ -0,0 +1,196 @@
+import asyncio
+import time
+import pytest
+from httpx import AsyncClient
+from app.core.config import settings
+from app.routers import health_router
+
+PROBE_PATHS = {
+    "/health": {"status": "healthy", "version": settings.VERSION},
+    "/api/v1/health/health/live": {"status": "alive", "message": "Application is alive"},
+}
+
+class TestHealthCheckInterceptor:
+
+    @pytest.mark.parametrize("path", PROBE_PATHS)
+    async def test_get_probe(self, client: AsyncClient, path: str):
+        """Test probe paths are answered with the prebuilt body"""
+        response = await client.get(path)
+        assert response.status_code == 200
+        assert response.json() == PROBE_PATHS[path]
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["cache-control"] == "no-store"
+        # Answered before the middleware stack runs
+        assert "x-request-id" not in response.headers
+
+    @pytest.mark.parametrize("path", PROBE_PATHS)
+    async def test_head_probe(self, client: AsyncClient, path: str):
+        """Test HEAD on probe paths returns headers without a body"""
+        response = await client.head(path)
+        assert response.status_code == 200
+        assert response.content == b""
+        assert int(response.headers["content-length"]) > 0
+
+    @pytest.mark.parametrize("path", PROBE_PATHS)
+    async def test_post_probe_not_allowed(self, client: AsyncClient, path: str):
+        """Test other methods on probe paths are rejected"""
+        response = await client.post(path)
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET, HEAD"
+        assert response.json() == {"detail": "Method Not Allowed"}
+
+    async def test_other_paths_pass_through(self, client: AsyncClient):
+        """Test non-probe paths reach the FastAPI application"""
+        response = await client.get("/api/v1/health/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+        assert "x-request-id" in response.headers
+
+DETAILED_PATH = "/api/v1/health/health/detailed"
+
+async def healthy_check():
+    return {"status": "healthy"}
+
+def healthy_system_check():
+    return {"status": "healthy"}
+
+@pytest.fixture
+def fake_checks(monkeypatch):
+    """Replace the component checks with healthy stubs and start from an empty cache"""
+    monkeypatch.setattr(health_router.HealthChecker, "check_database", staticmethod(healthy_check))
+    monkeypatch.setattr(health_router.HealthChecker, "check_system_resources", staticmethod(healthy_system_check))
+    monkeypatch.setattr(health_router.HealthChecker, "check_external_dependencies", staticmethod(healthy_check))
+    monkeypatch.setattr(health_router.health_cache, "value", None)
+    monkeypatch.setattr(health_router.health_cache, "expires_at", 0.0)
+    return monkeypatch
+
+class TestDetailedHealthCheck:
+
+    async def test_check_timeout_is_unhealthy(self, client: AsyncClient, fake_checks):
+        """Test a check outliving HEALTH_CHECK_TIMEOUT is reported unhealthy with a 503"""
+        async def hanging_check():
+            await asyncio.sleep(1)
+        fake_checks.setattr(health_router, "HEALTH_CHECK_TIMEOUT", 0.05)
+        fake_checks.setattr(health_router.HealthChecker, "check_external_dependencies", staticmethod(hanging_check))
+        
+        response = await client.get(DETAILED_PATH)
+        assert response.status_code == 503
+        report = response.json()["detail"]
+        assert report["status"] == "unhealthy"
+        assert report["components"]["external"] == {"status": "unhealthy", "message": "External check timed out"}
+        assert report["components"]["database"] == {"status": "healthy"}
+
+    async def test_check_exception_is_unhealthy(self, client: AsyncClient, fake_checks):
+        """Test a check raising an exception is reported unhealthy with a 503"""
+        async def failing_check():
+            raise RuntimeError("connection refused")
+        fake_checks.setattr(health_router.HealthChecker, "check_database", staticmethod(failing_check))
+        
+        response = await client.get(DETAILED_PATH)
+        assert response.status_code == 503
+        report = response.json()["detail"]
+        assert report["status"] == "unhealthy"
+        assert report["components"]["database"] == {
+            "status": "unhealthy", "message": "Database check error: connection refused"
+        }
+
+    async def test_cached_report_is_not_rebuilt(self, client: AsyncClient, fake_checks):
+        """Test a second request within the TTL is served from the cache"""
+        builds = []
+        build_health_report = health_router.build_health_report
+        async def counting_build():
+            builds.append(1)
+            return await build_health_report()
+        fake_checks.setattr(health_router, "build_health_report", counting_build)
+        
+        first = await client.get(DETAILED_PATH)
+        second = await client.get(DETAILED_PATH)
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert len(builds) == 1
+
+    async def test_stale_report_served_while_refreshing(self, client: AsyncClient, fake_checks):
+        """Test the expired report is served while another refresh holds the lock"""
+        stale_report = {"status": "degraded", "components": {}}
+        health_router.health_cache.value = stale_report
+        
+        async with health_router.health_cache.lock:
+            response = await asyncio.wait_for(client.get(DETAILED_PATH), 1)
+        assert response.status_code == 200
+        assert response.json() == stale_report
+
+class TestDnsCheck:
+
+    @pytest.fixture(autouse=True)
+    def empty_dns_cache(self, monkeypatch):
+        monkeypatch.setattr(health_router, "_dns_cache", {})
+
+    async def test_cache_hit_skips_lookup(self, monkeypatch):
+        """Test a successful lookup is reused until DNS_CACHE_TTL expires"""
+        lookups = []
+        monkeypatch.setattr(health_router.socket, "getaddrinfo", lambda host, port: lookups.append(host))
+        
+        first = await health_router.HealthChecker.check_external_dependencies()
+        second = await health_router.HealthChecker.check_external_dependencies()
+        assert first["status"] == second["status"] == "healthy"
+        assert second["checks"][0]["status"] == "healthy"
+        assert lookups == [settings.HEALTH_DNS_PROBE_HOST]
+
+    async def test_lookup_timeout_is_degraded(self, monkeypatch):
+        """Test a lookup outliving DNS_CHECK_TIMEOUT degrades the check and is not cached"""
+        monkeypatch.setattr(health_router, "DNS_CHECK_TIMEOUT", 0.05)
+        monkeypatch.setattr(health_router.socket, "getaddrinfo", lambda host, port: time.sleep(0.2))
+        
+        result = await health_router.HealthChecker.check_external_dependencies()
+        assert result["status"] == "degraded"
+        assert result["checks"][0]["status"] == "unhealthy"
+        assert "timed out" in result["checks"][0]["message"]
+        assert health_router._dns_cache == {}
+
+READY_PATH = "/api/v1/health/health/ready"
+
+async def ping_ok():
+    pass
+
+async def ping_error():
+    raise ConnectionRefusedError("connection refused")
+
+async def ping_hang():
+    await asyncio.sleep(1)
+
+class TestDatabaseCheck:
+
+    async def test_database_healthy(self, client: AsyncClient, monkeypatch):
+        """Test a successful ping makes the database check and readiness probe healthy"""
+        monkeypatch.setattr(health_router, "_ping_database", ping_ok)
+        
+        result = await health_router.HealthChecker.check_database()
+        assert result["status"] == "healthy"
+        
+        response = await client.get(READY_PATH)
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+    async def test_database_error(self, client: AsyncClient, monkeypatch):
+        """Test a failing ping is reported unhealthy and fails the readiness probe"""
+        monkeypatch.setattr(health_router, "_ping_database", ping_error)
+        
+        result = await health_router.HealthChecker.check_database()
+        assert result["status"] == "unhealthy"
+        assert result["message"] == "Database error: connection refused"
+        
+        response = await client.get(READY_PATH)
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Application not ready"}
+
+    async def test_database_hang(self, client: AsyncClient, monkeypatch):
+        """Test a ping outliving DB_CHECK_TIMEOUT is reported unhealthy and fails the readiness probe"""
+        monkeypatch.setattr(health_router, "_ping_database", ping_hang)
+        monkeypatch.setattr(health_router, "DB_CHECK_TIMEOUT", 0.05)
+        
+        result = await health_router.HealthChecker.check_database()
+        assert result["status"] == "unhealthy"
+        assert result["message"] == "Database did not respond within 0.05s"
+        
+        response = await asyncio.wait_for(client.get(READY_PATH), 1)
+        assert response.status_code == 503
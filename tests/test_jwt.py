@@ -0,0 +1,30 @@
+import time
+from types import SimpleNamespace
+from datetime import timedelta
+from app.utils import jwt as jwt_utils
+from app.utils.jwt import create_access_token, verify_token
+
+class TestVerifyToken:
+
+    def setup_method(self):
+        jwt_utils._decode_token.cache_clear()
+
+    def test_valid_token(self):
+        """Test a valid token returns its subject"""
+        token = create_access_token({"sub": "jwt@example.com"})
+        assert verify_token(token) == {"sub": "jwt@example.com"}
+
+    def test_cached_token_rejected_after_expiry(self, monkeypatch):
+        """Test a token already in the cache is rejected once it expires"""
+        token = create_access_token({"sub": "jwt@example.com"}, expires_delta=timedelta(minutes=1))
+        assert verify_token(token) == {"sub": "jwt@example.com"}
+        assert jwt_utils._decode_token.cache_info().currsize == 1
+
+        monkeypatch.setattr(jwt_utils, "time", SimpleNamespace(time=lambda: time.time() + 120))
+        assert verify_token(token) is None
+
+    def test_invalid_tokens_are_not_cached(self):
+        """Test rejected tokens do not take up cache entries"""
+        assert verify_token("not-a-jwt") is None
+        assert verify_token(create_access_token({"role": "no-subject"})) is None
+        assert jwt_utils._decode_token.cache_info().currsize == 0
@@ -0,0 +1,51 @@
+import logging
+import sys
+import orjson
+from app.core.logging_config import ColoredFormatter, OrjsonFormatter
+
+def make_record(msg: str, *args, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("app", logging.ERROR, __file__, 10, msg, args, exc_info, func="handler")
+
+class TestOrjsonFormatter:
+
+    def test_escapes_message(self):
+        """Test quotes and newlines in the message still produce one valid JSON line"""
+        output = OrjsonFormatter().format(make_record('user "%s"\nlogged in', "alice"))
+        assert "\n" not in output
+        payload = orjson.loads(output)
+        assert payload["message"] == 'user "alice"\nlogged in'
+        assert payload["level"] == "ERROR"
+        assert payload["logger"] == "app"
+        assert payload["function"] == "handler"
+        assert payload["line"] == 10
+        assert "exception" not in payload
+
+    def test_includes_exception(self):
+        """Test exc_info is serialized as the formatted traceback"""
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            record = make_record("Request failed", exc_info=sys.exc_info())
+        payload = orjson.loads(OrjsonFormatter().format(record))
+        assert payload["message"] == "Request failed"
+        assert payload["exception"].startswith("Traceback")
+        assert "ValueError: bad value" in payload["exception"]
+
+class TestColoredFormatter:
+
+    def test_colors_level_and_restores_record(self):
+        """Test the level is colored in the output but left unchanged on the record"""
+        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        formatter._enabled = True
+        record = make_record("boom")
+        output = formatter.format(record)
+        assert output == f"{ColoredFormatter.COLORS['ERROR']}ERROR{ColoredFormatter.RESET} - boom"
+        assert record.levelname == "ERROR"
+
+    def test_no_colors_when_disabled(self):
+        """Test no ANSI codes are emitted when stdout is not a terminal"""
+        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        formatter._enabled = False
+        output = formatter.format(make_record("boom"))
+        assert output == "ERROR - boom"
+        assert "\033[" not in output
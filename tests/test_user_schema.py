@@ -0,0 +1,22 @@
+import pytest
+from pydantic import ValidationError
+from app.schemas.user_schema import UserCreate, UserLogin
+
+class TestLoginEmail:
+
+    @pytest.mark.parametrize("email", ["user@example.com", "First.Last@Example.COM", "user+tag@mail.example.org"])
+    def test_login_email_matches_registered_email(self, email: str):
+        """Test a login email normalizes to the address stored at registration"""
+        registered = UserCreate(email=email, username="user", password="password123")
+        login = UserLogin(email=email, password="password123")
+        assert login.email == registered.email
+
+    def test_login_email_lowercases_domain_only(self):
+        """Test the domain is lowercased and the local part is preserved"""
+        assert UserLogin(email="First.Last@Example.COM", password="x").email == "First.Last@example.com"
+
+    @pytest.mark.parametrize("email", ["", "plainaddress", "user@", "@example.com", "user@example", "user name@example.com"])
+    def test_login_rejects_invalid_email(self, email: str):
+        """Test malformed login emails are rejected"""
+        with pytest.raises(ValidationError, match="value is not a valid email address"):
+            UserLogin(email=email, password="x")
@@ -1,6 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from app.schemas.user_schema import UserCreate
+from app.core.config import settings
 
 class TestUserAPI:
     
@@ -81,7 +82,7 @@ class TestUserAPI:
     async def test_get_current_user_unauthorized(self, client: AsyncClient):
         """Test getting current user without authentication"""
         response = await client.get("/api/v1/users/me")
-        assert response.status_code == 401
+        assert response.status_code == 403
     
     async def test_get_users(self, client: AsyncClient, auth_headers):
         """Test getting all users"""
@@ -105,7 +106,7 @@ class TestUserAPI:
     async def test_delete_user(self, client: AsyncClient, auth_headers, test_user_id):
         """Test deleting user"""
         response = await client.delete(f"/api/v1/users/{test_user_id}", headers=auth_headers)
-        assert response.status_code == 200
+        assert response.status_code == 204
         
         # Verify user is deleted
         response = await client.get(f"/api/v1/users/{test_user_id}", headers=auth_headers)
@@ -115,13 +116,13 @@ class TestUserAPI:
         """Test health check endpoint"""
         response = await client.get("/health")
         assert response.status_code == 200
-        assert response.json() == {"status": "healthy"}
+        assert response.json() == {"status": "healthy", "version": settings.VERSION}
     
     async def test_root_endpoint(self, client: AsyncClient):
         """Test root endpoint"""
         response = await client.get("/")
         assert response.status_code == 200
-        assert "FastAPI Users API is running!" in response.json()["message"]
+        assert response.json()["message"] == f"Welcome to {settings.APP_NAME}"
     
     async def test_get_users_unauthorized(self, client: AsyncClient):
         """Test getting users without authentication"""